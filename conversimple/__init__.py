@@ -7,7 +7,7 @@ the Conversimple platform's WebRTC infrastructure and conversation management.
 
 from .agent import ConversimpleAgent
 from .dispatcher import AgentRegistry, ConversimpleDispatcher, run_dispatcher
-from .tools import tool, tool_async
+from .tools import RawJSONResult, tool, tool_async
 from .callbacks import (
     ConversationLifecycleEvent,
     ToolCallEvent,
@@ -20,6 +20,7 @@ __all__ = [
     "ConversimpleAgent",
     "tool", 
     "tool_async",
+    "RawJSONResult",
     "ConversationLifecycleEvent",
     "ToolCallEvent", 
     "ErrorEvent",
@@ -0,0 +1,5 @@
+"""Run the Conversimple dispatcher: ``python -m conversimple``."""
+
+from .cli import main
+
+main(prog="python -m conversimple")
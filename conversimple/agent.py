@@ -13,12 +13,12 @@ import json
 import logging
 import os
 import uuid
-from typing import Dict, List, Optional, Callable, Any, Union
+from typing import Dict, List, Optional, Callable, Any, Tuple, Union
 from datetime import datetime
 import datetime as dt
 
 from .connection import WebSocketConnection
-from .tools import ToolRegistry, ToolCall, auto_register_tools
+from .tools import RawJSONResult, ToolRegistry, ToolCall, auto_register_tools, collect_tool_specs
 from .callbacks import CallbackManager
 from .utils import setup_logging
 
@@ -33,6 +33,13 @@ class ConversimpleAgent:
     Each agent instance handles a single conversation lifecycle.
     """
 
+    # (attribute name, tool_info) for each decorated tool, computed once per class
+    _conversimple_tool_specs: Tuple[Tuple[str, Dict], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._conversimple_tool_specs = collect_tool_specs(cls)
+
     def __init__(
         self,
         api_key: str,
@@ -349,12 +356,16 @@ class ConversimpleAgent:
 
     async def _send_tool_result(self, call_id: str, result: Any) -> None:
         """Send tool execution result to platform."""
-        message = {
-            "call_id": call_id,
-            "result": result
-        }
-        
-        await self.connection.send_message("tool_call_response", message)
+        if isinstance(result, RawJSONResult):
+            # Splice the pre-encoded result in rather than decoding and re-encoding it
+            frame = b'{"call_id": %s, "result": %s}' % (json.dumps(call_id).encode("utf-8"), result.payload)
+            await self.connection.send_encoded_message("tool_call_response", frame)
+        else:
+            message = {
+                "call_id": call_id,
+                "result": result
+            }
+            await self.connection.send_message("tool_call_response", message)
         logger.debug(f"Sent tool result for call: {call_id}")
 
     async def _send_tool_error(self, call_id: str, error: str) -> None:
@@ -0,0 +1,57 @@
+"""
+Command-line entry point for the Conversimple dispatcher.
+
+Run with ``python -m conversimple`` or the ``conversimple-dispatcher`` console
+script. This lives outside `dispatcher.py` because the package imports that
+module, and running an already-imported module with ``-m`` makes runpy warn.
+"""
+
+import argparse
+import asyncio
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from .dispatcher import run_dispatcher
+from .utils import DEFAULT_PLATFORM_URL, setup_logging
+
+
+async def _run_cli(api_key: str, platform_url: str, search_path: Optional[Path]) -> None:
+    """Run the dispatcher on the CLI's own event loop."""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        # Python 3.12+: tasks that finish without suspending (duplicate or
+        # unknown conversations, failed lookups) skip a trip through the scheduler.
+        # Only set here: asyncio.run() gave us this loop, so nobody else's
+        # tasks are affected.
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    await run_dispatcher(api_key=api_key, platform_url=platform_url, search_path=search_path)
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None) -> None:
+    """Parse command-line arguments and run the dispatcher until interrupted."""
+    parser = argparse.ArgumentParser(prog=prog, description="Run the Conversimple agent dispatcher.")
+    parser.add_argument("--api-key", default=os.getenv("CONVERSIMPLE_API_KEY"), help="Customer API key")
+    parser.add_argument(
+        "--platform-url",
+        default=os.getenv("CONVERSIMPLE_PLATFORM_URL", DEFAULT_PLATFORM_URL),
+        help="Platform WebSocket URL",
+    )
+    parser.add_argument("--search-path", type=Path, default=None, help="Directory containing agent modules")
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error("--api-key or CONVERSIMPLE_API_KEY is required")
+
+    setup_logging()
+
+    # uvloop has to be selected before the event loop is created.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    asyncio.run(_run_cli(args.api_key, args.platform_url, args.search_path))
@@ -12,14 +12,19 @@ import asyncio
 import json
 import logging
 import time
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, Union
 from urllib.parse import urlencode
 
 import websockets
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
+from .utils import loads
+
 logger = logging.getLogger(__name__)
 
+# Decoder for inbound frames, taking the raw str/bytes frame directly
+parse_payload: Callable[[Union[str, bytes]], Any] = loads
+
 
 class ConnectionError(Exception):
     """Base exception for connection errors."""
@@ -170,21 +175,27 @@ class WebSocketConnection:
 
     async def send_message(self, event: str, payload: Dict) -> None:
         """Send message to platform via Phoenix channel."""
+        await self.send_encoded_message(event, json.dumps(payload))
+
+    async def send_encoded_message(self, event: str, payload: Union[str, bytes]) -> None:
+        """Send message whose payload is already JSON-encoded, splicing it in verbatim."""
         if not self.connected or not self.channel_joined:
             logger.warning(f"Cannot send message {event}: not connected")
             return
             
-        # Phoenix WebSocket message format (as JSON object)
-        message = {
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+            
+        # Phoenix WebSocket message format (as JSON object), with the payload last
+        header = json.dumps({
             "join_ref": None,  # join_ref (not used for regular messages)
             "ref": self._next_message_ref(),
             "topic": f"customer:{self.customer_id}",
-            "event": event,
-            "payload": payload
-        }
+            "event": event
+        })
         
         try:
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(f'{header[:-1]}, "payload": {payload}}}')
             logger.debug(f"Sent message: {event}")
             
         except Exception as e:
@@ -212,7 +223,7 @@ class WebSocketConnection:
             
             # Wait for join confirmation
             response = await self.websocket.recv()
-            response_data = json.loads(response)
+            response_data = parse_payload(response)
             
             # Handle both array and object response formats
             if isinstance(response_data, list):
@@ -296,7 +307,7 @@ class WebSocketConnection:
     async def _handle_message(self, raw_message: str) -> None:
         """Handle incoming WebSocket message."""
         try:
-            message_data = json.loads(raw_message)
+            message_data = parse_payload(raw_message)
             
             # Phoenix WebSocket message format: [join_ref, ref, topic, event, payload]
             if isinstance(message_data, list) and len(message_data) >= 4:
@@ -4,35 +4,58 @@ Dispatcher for managing multiple Conversimple agents.
 The dispatcher establishes a lightweight control-plane connection to the
 platform, listens for `conversation_ready` events, and spins up dedicated
 `ConversimpleAgent` instances for each conversation. Agents are discovered
-dynamically by scanning the current working directory for classes that
-inherit from `ConversimpleAgent` and expose an `agent_id` attribute.
+by scanning the current working directory for classes that inherit from
+`ConversimpleAgent` and expose an `agent_id` attribute; modules declaring
+literal ids are only imported once one of their agents is needed.
 """
 
+import ast
 import asyncio
-import contextlib
+import hashlib
+import importlib
 import importlib.util
-import inspect
 import logging
+import os
+import signal
 import sys
+import tokenize
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
-from typing import Dict, Optional, Type
+from typing import Awaitable, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Type
 
 from .agent import ConversimpleAgent
 from .connection import WebSocketConnection
 
 logger = logging.getLogger(__name__)
 
+# Number of session shards; must be a power of two for the hash mask.
+_SESSION_SHARDS = 16
+
+# Longest an agent start holds a start permit: about one handshake (websockets'
+# default open timeout). Connection retries after that don't hold a permit.
+_HANDSHAKE_TIMEOUT = 10.0
+
+_AGENT_ID_ATTRS = frozenset({"agent_id", "AGENT_ID"})
+_IGNORED_TOKENS = frozenset({tokenize.ENCODING, tokenize.NL, tokenize.COMMENT})
+_OPEN_BRACKETS = frozenset({"(", "[", "{"})
+_CLOSE_BRACKETS = frozenset({")", "]", "}"})
+_COMPARISONS = frozenset({"==", "!=", "<=", ">="})
+# Top-level blocks whose bodies don't bind module attributes when imported
+_OPAQUE_BLOCKS = frozenset({"def", "async", "__main__"})
+
 
 @dataclass
 class RegisteredAgent:
     """Information about a discovered agent implementation."""
 
+    __slots__ = ("agent_id", "cls", "module_name", "file_path", "class_name")
+
     agent_id: str
-    cls: Type[ConversimpleAgent]
+    cls: Optional[Type[ConversimpleAgent]]  # None until the module is imported
     module_name: str
     file_path: Path
+    class_name: str
 
 
 class AgentRegistry:
@@ -41,8 +64,21 @@ class AgentRegistry:
 
     Any class that inherits from `ConversimpleAgent` and defines an `agent_id`
     attribute (or `AGENT_ID` constant) will be registered.
+
+    Files whose top-level subclasses all assign `agent_id` a string literal
+    are registered from their tokens alone and only imported the first time
+    `get()` asks for one of their agents. Any other file is imported during
+    discovery so computed or inherited ids are still found. A token-registered
+    class that turns out not to be a `ConversimpleAgent` is dropped on import
+    and the search path is discovered again, so real agents it shadowed are
+    still found.
     """
 
+    # Loaded modules keyed by file path, reused while the file's mtime is unchanged.
+    _module_cache: ClassVar[Dict[Path, Tuple[int, ModuleType]]] = {}
+    # Static scan results keyed by file path, under the same mtime rule.
+    _scan_cache: ClassVar[Dict[Path, Tuple[int, Optional[List[Tuple[str, str]]]]]] = {}
+
     def __init__(self, search_path: Path):
         self.search_path = Path(search_path)
         self._agents: Dict[str, RegisteredAgent] = {}
@@ -57,37 +93,201 @@ class AgentRegistry:
             logger.warning("Agent registry search path does not exist: %s", self.search_path)
             return
 
-        for python_file in self._iter_python_files(self.search_path):
-            try:
-                module = self._load_module(python_file)
-            except Exception as exc:
-                logger.exception("Failed to load module %s: %s", python_file, exc)
-                continue
-
-            self._register_module_agents(module, python_file)
+        for python_file, mtime_ns in self._iter_python_files(self.search_path):
+            cached = self._module_cache.get(python_file)
+            # Already-imported files are registered from their real classes.
+            if cached is None or cached[0] != mtime_ns:
+                declared = self._scan_cached(python_file, mtime_ns)
+                if declared:
+                    module_name = self._module_name(python_file)
+                    for class_name, agent_id in declared:
+                        self._register(agent_id, None, class_name, module_name, python_file)
+                    continue
+
+            module = self._load_cached(python_file, mtime_ns)
+            if module is not None:
+                self._register_module_agents(module, python_file)
 
     def get(self, agent_id: str) -> Optional[RegisteredAgent]:
-        """Retrieve a registered agent by id."""
-        return self._agents.get(agent_id)
+        """Retrieve a registered agent by id, importing its module on first use."""
+        registered = self._agents.get(agent_id)
+        # Each pass imports one more file, so this ends once the id resolves
+        # to a real agent or nothing is left to try.
+        while registered is not None and registered.cls is None:
+            registered = self._resolve(registered)
+        return registered
 
     # Internal helpers -----------------------------------------------------
 
-    def _iter_python_files(self, root: Path):
-        """Yield .py files within the root directory (non-recursive)."""
-        for entry in sorted(root.iterdir()):
+    def _resolve(self, registered: RegisteredAgent) -> Optional[RegisteredAgent]:
+        """Import a token-registered agent's module and bind its class."""
+        agent_id = registered.agent_id
+        try:
+            mtime_ns = os.stat(registered.file_path).st_mtime_ns
+        except OSError as exc:
+            logger.error("Agent %s source is no longer readable: %s", agent_id, exc)
+            return None
+
+        module = self._load_cached(registered.file_path, mtime_ns)
+        if module is None:
+            return None
+
+        obj = vars(module).get(registered.class_name)
+        if isinstance(obj, type) and issubclass(obj, ConversimpleAgent):
+            registered.cls = obj
+            # Also register any agents the module has that the scan couldn't see,
+            # so what's registered doesn't depend on which module loaded first.
+            self._register_module_agents(module, registered.file_path)
+            return registered
+
+        # The token scan can't see base classes; now that the module is
+        # imported, register what it really defines and rediscover the id.
+        logger.info(
+            "%s in %s is not a ConversimpleAgent subclass; rediscovering agent %s",
+            registered.class_name,
+            registered.file_path,
+            agent_id,
+        )
+        for stale_id, entry in list(self._agents.items()):
+            if entry.cls is None and entry.file_path == registered.file_path:
+                del self._agents[stale_id]
+        self._register_module_agents(module, registered.file_path)
+        self.discover()
+        return self._agents.get(agent_id)
+
+    def _iter_python_files(self, root: Path) -> Iterator[Tuple[Path, int]]:
+        """Yield (path, mtime_ns) for .py files within the root directory (non-recursive)."""
+        # A single scandir pass; DirEntry caches file type so no extra stat per entry.
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        for entry in entries:
+            # Follows symlinks, so symlinked agent packages are found; the scan
+            # isn't recursive, so a link back to the search path can't loop.
             if entry.is_dir():
                 # Allow packages with __init__.py by loading their __init__.
-                init_file = entry / "__init__.py"
-                if init_file.exists():
-                    yield init_file
+                init_file = os.path.join(entry.path, "__init__.py")
+                try:
+                    mtime_ns = os.stat(init_file).st_mtime_ns
+                except OSError:
+                    continue
+                yield Path(init_file), mtime_ns
                 continue
 
-            if entry.suffix == ".py" and entry.name not in {"__init__.py"}:
-                yield entry
+            if entry.name.endswith(".py") and entry.name != "__init__.py":
+                yield Path(entry.path), entry.stat().st_mtime_ns
+
+    def _scan_cached(self, file_path: Path, mtime_ns: int) -> Optional[List[Tuple[str, str]]]:
+        """Return static (class_name, agent_id) pairs, reusing the last scan if unchanged."""
+        cached = self._scan_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        declared = self._scan_agent_ids(file_path)
+        self._scan_cache[file_path] = (mtime_ns, declared)
+        return declared
+
+    def _load_cached(self, file_path: Path, mtime_ns: int) -> Optional[ModuleType]:
+        """Load a module, reusing the cached one while the file is unchanged."""
+        cached = self._module_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        if cached is not None:
+            # Source changed since the last load; drop stale finder caches.
+            importlib.invalidate_caches()
+        try:
+            module = self._load_module(file_path)
+        except Exception as exc:
+            logger.exception("Failed to load module %s: %s", file_path, exc)
+            return None
+        self._module_cache[file_path] = (mtime_ns, module)
+        return module
+
+    @staticmethod
+    def _scan_agent_ids(file_path: Path) -> Optional[List[Tuple[str, str]]]:
+        """
+        Find top-level classes that assign `agent_id`/`AGENT_ID` a string literal.
+
+        Returns None when the file can't be tokenized, assigns an id that
+        isn't a plain string literal, has a subclass that doesn't assign
+        `agent_id` itself (it may inherit one), or has module-level code that
+        could bind a class the scan can't see (a decorated or nested class, a
+        non-literal assignment such as `type(...)`, a loop), so the caller
+        falls back to importing it.
+        """
+        # Class name -> {attribute: literal id}, for classes with a base list
+        class_ids: Dict[str, Dict[str, str]] = {}
+        current_class: Optional[str] = None
+        top_level = ""  # First token of the enclosing top-level statement
+        depth = 0
+        line_depth = 0
+        line: List[tokenize.TokenInfo] = []
+
+        try:
+            with open(file_path, "rb") as source:
+                for token in tokenize.tokenize(source.readline):
+                    if token.type == tokenize.INDENT:
+                        depth += 1
+                    elif token.type == tokenize.DEDENT:
+                        depth -= 1
+                    elif token.type == tokenize.NEWLINE:
+                        first = line[0]
+                        if line_depth == 0:
+                            top_level = "__main__" if _is_main_guard(line) else first.string
+                            if top_level == "class":
+                                # Only classes with a base list can be ConversimpleAgent subclasses.
+                                is_subclass = (
+                                    len(line) > 3
+                                    and line[2].string == "("
+                                    and line[3].string != ")"
+                                )
+                                current_class = line[1].string if is_subclass else None
+                                if current_class:
+                                    class_ids[current_class] = {}
+                            elif top_level not in _OPAQUE_BLOCKS and _may_bind_class(line):
+                                return None
+                        elif top_level == "class":
+                            if (
+                                line_depth == 1
+                                and current_class
+                                and first.type == tokenize.NAME
+                                and first.string in _AGENT_ID_ATTRS
+                            ):
+                                agent_id = _literal_assignment(line)
+                                if agent_id is None:
+                                    return None
+                                class_ids[current_class].setdefault(first.string, agent_id)
+                        elif top_level not in _OPAQUE_BLOCKS and _may_bind_class(line):
+                            # Module-level code inside an if/try/while block
+                            return None
+                        line = []
+                    elif token.type not in _IGNORED_TOKENS:
+                        if not line:
+                            line_depth = depth
+                        line.append(token)
+        except (OSError, SyntaxError, tokenize.TokenError):
+            return None
+
+        declared: List[Tuple[str, str]] = []
+        for class_name, ids in sorted(class_ids.items()):
+            # agent_id wins over AGENT_ID even when inherited, so a class that
+            # only sets AGENT_ID has to be imported to see which one applies.
+            if "agent_id" not in ids:
+                return None
+            declared.append((class_name, ids["agent_id"]))
+        return declared
+
+    @staticmethod
+    def _module_name(file_path: Path) -> str:
+        # Packages are named after their directory so every `__init__.py`
+        # doesn't collide on `dispatcher_auto.__init__`.
+        stem = file_path.parent.name if file_path.name == "__init__.py" else file_path.stem
+        return f"dispatcher_auto.{stem}"
 
     def _load_module(self, file_path: Path) -> ModuleType:
         """Dynamically import a Python module from a file."""
-        module_name = f"dispatcher_auto.{file_path.stem}"
+        module_name = self._module_name(file_path)
         spec = importlib.util.spec_from_file_location(module_name, file_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Unable to create import spec for {file_path}")
@@ -101,10 +301,12 @@ class AgentRegistry:
 
     def _register_module_agents(self, module: ModuleType, file_path: Path) -> None:
         """Inspect module for agent classes and register them."""
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if not issubclass(obj, ConversimpleAgent) or obj is ConversimpleAgent:
+        # Sorted by name, like inspect.getmembers, so duplicate ids resolve the same way.
+        for name, obj in sorted(vars(module).items()):
+            if not isinstance(obj, type) or not issubclass(obj, ConversimpleAgent) or obj is ConversimpleAgent:
                 continue
 
+            # agent_id, even an inherited one, takes precedence over AGENT_ID.
             agent_id = getattr(obj, "agent_id", None) or getattr(obj, "AGENT_ID", None)
             if not agent_id:
                 logger.debug(
@@ -114,29 +316,114 @@ class AgentRegistry:
                 )
                 continue
 
-            if agent_id in self._agents:
-                existing = self._agents[agent_id]
-                logger.warning(
-                    "Duplicate agent_id %s found in %s (already registered by %s)",
-                    agent_id,
-                    file_path,
-                    existing.file_path,
-                )
-                continue
+            self._register(agent_id, obj, name, module.__name__, file_path)
 
-            self._agents[agent_id] = RegisteredAgent(
-                agent_id=agent_id,
-                cls=obj,
-                module_name=module.__name__,
-                file_path=file_path,
+    def _register(
+        self,
+        agent_id: str,
+        cls: Optional[Type[ConversimpleAgent]],
+        class_name: str,
+        module_name: str,
+        file_path: Path,
+    ) -> None:
+        """Record an agent unless its id is already taken."""
+        if agent_id in self._agents:
+            existing = self._agents[agent_id]
+            if existing.file_path == file_path and existing.class_name == class_name:
+                # Seen again on rediscovery; just bind the class if we now have it.
+                existing.cls = existing.cls or cls
+                return
+            logger.warning(
+                "Duplicate agent_id %s found in %s (already registered by %s)",
+                agent_id,
+                file_path,
+                existing.file_path,
             )
-            logger.info("Registered agent %s (%s) from %s", agent_id, name, file_path)
+            return
+
+        self._agents[agent_id] = RegisteredAgent(
+            agent_id=agent_id,
+            cls=cls,
+            module_name=module_name,
+            file_path=file_path,
+            class_name=class_name,
+        )
+        logger.info("Registered agent %s (%s) from %s", agent_id, class_name, file_path)
+
+
+def _is_main_guard(line: List[tokenize.TokenInfo]) -> bool:
+    """Whether a line is `if __name__ == "__main__":`, whose body doesn't run on import."""
+    strings = [token.string for token in line]
+    return (
+        len(strings) == 5
+        and strings[:3] == ["if", "__name__", "=="]
+        and strings[4] == ":"
+        and _is_literal(line[3:4])
+        and ast.literal_eval(strings[3]) == "__main__"
+    )
+
+
+def _may_bind_class(line: List[tokenize.TokenInfo]) -> bool:
+    """Whether a module-level statement could bind a class the token scan can't see."""
+    if line[0].string in ("@", "for", "with") or any(
+        token.type == tokenize.NAME and token.string == "class" for token in line
+    ):
+        return True
+
+    nesting = 0
+    value_start: Optional[int] = None
+    for index, token in enumerate(line):
+        if token.type != tokenize.OP:
+            continue
+        if token.string in _OPEN_BRACKETS:
+            nesting += 1
+        elif token.string in _CLOSE_BRACKETS:
+            nesting -= 1
+        elif token.string == ":=":
+            return True
+        elif nesting == 0 and token.string.endswith("=") and token.string not in _COMPARISONS:
+            if token.string != "=":
+                return True  # Augmented assignment
+            value_start = index + 1
+
+    # Assigning a literal constant can't create a class
+    return value_start is not None and not _is_literal(line[value_start:])
+
+
+def _is_literal(tokens: List[tokenize.TokenInfo]) -> bool:
+    """Whether tokens spell out a Python literal."""
+    try:
+        ast.literal_eval(" ".join(token.string for token in tokens))
+    except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError):
+        return False
+    return True
+
+
+def _literal_assignment(line: List[tokenize.TokenInfo]) -> Optional[str]:
+    """Return the string assigned by `name = "..."` / `name: str = "..."`, else None."""
+    for index, token in enumerate(line):
+        if token.type == tokenize.OP and token.string == "=":
+            value_tokens = line[index + 1:]
+            break
+    else:
+        return None
+
+    if not value_tokens or any(token.type != tokenize.STRING for token in value_tokens):
+        return None
+
+    try:
+        value = ast.literal_eval(" ".join(token.string for token in value_tokens))
+    except (SyntaxError, ValueError):
+        return None
+    return value if isinstance(value, str) and value else None
 
 
 @dataclass
 class AgentSession:
     """Runtime information about a spawned agent instance."""
 
+    __slots__ = ("agent_id", "conversation_id", "agent", "task")
+
     agent_id: str
     conversation_id: str
     agent: ConversimpleAgent
@@ -152,16 +439,26 @@ class ConversimpleDispatcher:
         await dispatcher.start()
     """
 
+    # Connection event -> (log level, message, whether the message formats `data`)
+    _CONNECTION_EVENT_LOGS: ClassVar[Dict[str, Tuple[int, str, bool]]] = {
+        "connected": (logging.INFO, "Dispatcher control connection established", False),
+        "disconnected": (logging.INFO, "Dispatcher control connection closed", False),
+        "permanent_error": (logging.ERROR, "Dispatcher encountered permanent error: %s", True),
+        "error": (logging.ERROR, "Dispatcher connection error: %s", True),
+    }
+
     def __init__(
         self,
         api_key: str,
         platform_url: str = "ws://localhost:4000/sdk/websocket",
         search_path: Optional[Path] = None,
         customer_id: Optional[str] = None,
+        max_concurrent_starts: int = 8,
     ):
         self.api_key = api_key
         self.platform_url = platform_url
-        self.customer_id = customer_id
+        # Resolved once so spawned agents don't each re-derive it from the API key.
+        self.customer_id = customer_id or self._derive_customer_id(api_key)
         self.search_path = search_path or Path.cwd()
 
         self.registry = AgentRegistry(self.search_path)
@@ -170,26 +467,53 @@ class ConversimpleDispatcher:
         self.connection = WebSocketConnection(
             url=self.platform_url,
             api_key=self.api_key,
-            customer_id=self.customer_id or self._derive_customer_id(api_key),
+            customer_id=self.customer_id,
             max_reconnect_attempts=None,
         )
         self.connection.set_message_handler(self._handle_platform_message)
         self.connection.set_connection_handler(self._handle_connection_event)
 
-        self.active_sessions: Dict[str, AgentSession] = {}
+        # Routing table for control-plane events that need handling; built once.
+        self._event_handlers: Dict[str, Callable[[Dict], Awaitable[None]]] = {
+            "conversation_ready": self._handle_conversation_ready,
+            "conversation_lifecycle": self._handle_conversation_lifecycle,
+        }
+
+        # Sessions are split across small dicts keyed by conversation id hash so
+        # each stays small and shutdown can snapshot one shard at a time.
+        self._session_shards: List[Dict[str, AgentSession]] = [{} for _ in range(_SESSION_SHARDS)]
+
+        # Bounds how many agents connect at once so a burst of conversation_ready
+        # events can't flood the event loop with concurrent handshakes. Created
+        # in start(): before Python 3.10 a Semaphore binds to the loop current
+        # at construction, which may not be the one the dispatcher runs on.
+        self._max_concurrent_starts = max_concurrent_starts
+        self._start_semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def active_sessions(self) -> Dict[str, AgentSession]:
+        """Snapshot of all active sessions keyed by conversation id."""
+        sessions: Dict[str, AgentSession] = {}
+        for shard in self._session_shards:
+            sessions.update(shard)
+        return sessions
 
     async def start(self) -> None:
         """Connect dispatcher control plane to the platform."""
         logger.info("Starting Conversimple dispatcher (search path: %s)", self.search_path)
+        self._start_semaphore = asyncio.Semaphore(self._max_concurrent_starts)
         await self.connection.connect()
 
     async def stop(self) -> None:
         """Disconnect dispatcher and stop all managed agents."""
-        logger.info("Stopping Conversimple dispatcher, shutting down %d sessions", len(self.active_sessions))
+        sessions: List[AgentSession] = []
+        for shard in self._session_shards:
+            sessions.extend(shard.values())
+            shard.clear()
 
-        stop_tasks = [self._stop_session(session.conversation_id) for session in list(self.active_sessions.values())]
-        if stop_tasks:
-            await asyncio.gather(*stop_tasks, return_exceptions=True)
+        logger.info("Stopping Conversimple dispatcher, shutting down %d sessions", len(sessions))
+        if sessions:
+            await self._shutdown_sessions(sessions)
 
         await self.connection.disconnect()
 
@@ -197,10 +521,9 @@ class ConversimpleDispatcher:
 
     async def _handle_platform_message(self, event: str, payload: Dict) -> None:
         """Route incoming control-plane events."""
-        if event == "conversation_ready":
-            await self._handle_conversation_ready(payload)
-        elif event == "conversation_lifecycle":
-            await self._handle_conversation_lifecycle(payload)
+        handler = self._event_handlers.get(event)
+        if handler:
+            await handler(payload)
         elif event == "connection_warning":
             logger.warning("Dispatcher received connection warning: %s", payload.get("message"))
         elif event == "config_update":
@@ -221,12 +544,14 @@ class ConversimpleDispatcher:
             logger.warning("conversation_ready %s missing agent_id; cannot dispatch", conversation_id)
             return
 
-        if conversation_id in self.active_sessions:
+        shard = self._session_shard(conversation_id)
+        if conversation_id in shard:
             logger.info("Conversation %s already has an active agent", conversation_id)
             return
 
         registered = self.registry.get(agent_id)
-        if not registered:
+        # get() binds the class before returning; the cls check also narrows it for type checkers
+        if registered is None or registered.cls is None:
             logger.error("No agent registered for agent_id %s (conversation %s)", agent_id, conversation_id)
             return
 
@@ -237,7 +562,12 @@ class ConversimpleDispatcher:
         )
 
         task = asyncio.create_task(self._run_agent(agent_instance, conversation_id, agent_id, payload))
-        self.active_sessions[conversation_id] = AgentSession(
+        if task.done() and not task.result():
+            # With an eager task factory a start that fails synchronously has
+            # already finished (and cleaned up) before we get here.
+            return
+
+        shard[conversation_id] = AgentSession(
             agent_id=agent_id,
             conversation_id=conversation_id,
             agent=agent_instance,
@@ -261,61 +591,109 @@ class ConversimpleDispatcher:
         conversation_id: str,
         agent_id: str,
         payload: Dict,
-    ) -> None:
-        """Start agent for a conversation and handle failures."""
+    ) -> bool:
+        """Start agent for a conversation; returns False if it failed to start."""
+        if self._start_semaphore is None:  # Handlers driven without start()
+            self._start_semaphore = asyncio.Semaphore(self._max_concurrent_starts)
+
+        start_task: Optional[asyncio.Future] = None
         try:
-            logger.info("Starting agent %s for conversation %s", agent_id, conversation_id)
-            await agent.start(conversation_id=conversation_id)
+            async with self._start_semaphore:
+                logger.info("Starting agent %s for conversation %s", agent_id, conversation_id)
+                start_task = asyncio.ensure_future(agent.start(conversation_id=conversation_id))
+                # Hold the permit for one handshake at most: a failing connect()
+                # keeps retrying with backoff inside start(), and those retries
+                # mustn't stop other conversations from starting.
+                await asyncio.wait({start_task}, timeout=_HANDSHAKE_TIMEOUT)
+            await start_task
             logger.info("Agent %s connected for conversation %s", agent_id, conversation_id)
+            return True
         except Exception:
             logger.exception("Agent %s failed to start for conversation %s", agent_id, conversation_id)
-            self.active_sessions.pop(conversation_id, None)
+            self._session_shard(conversation_id).pop(conversation_id, None)
+            return False
+        finally:
+            # No-op once the start finished; stops it if we were cancelled
+            if start_task is not None:
+                start_task.cancel()
 
     async def _stop_session(self, conversation_id: str) -> None:
         """Stop and remove agent session for a conversation."""
-        session = self.active_sessions.pop(conversation_id, None)
+        session = self._session_shard(conversation_id).pop(conversation_id, None)
         if not session:
             return
 
-        logger.info("Stopping agent %s for conversation %s", session.agent_id, conversation_id)
+        await self._shutdown_sessions([session])
 
-        try:
-            await session.agent.stop()
-        except Exception:
-            logger.exception("Error stopping agent %s for conversation %s", session.agent_id, conversation_id)
-
-        if not session.task.done():
+    async def _shutdown_sessions(self, sessions: List[AgentSession]) -> None:
+        """Cancel start tasks and stop agents for the given sessions concurrently."""
+        # Cancel every pending start up front so none of them keeps connecting
+        # while the agents are being stopped.
+        for session in sessions:
+            logger.info("Stopping agent %s for conversation %s", session.agent_id, session.conversation_id)
             session.task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await session.task
+
+        results = await asyncio.gather(
+            *(session.agent.stop() for session in sessions),
+            return_exceptions=True,
+        )
+        for session, result in zip(sessions, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Error stopping agent %s for conversation %s",
+                    session.agent_id,
+                    session.conversation_id,
+                    exc_info=result,
+                )
+
+        await asyncio.gather(*(session.task for session in sessions), return_exceptions=True)
+
+    def _session_shard(self, conversation_id: str) -> Dict[str, AgentSession]:
+        """Return the shard that owns a conversation's session."""
+        return self._session_shards[hash(conversation_id) & (_SESSION_SHARDS - 1)]
 
     async def _handle_connection_event(self, event: str, data=None) -> None:
         """Log dispatcher connection lifecycle events."""
-        if event == "connected":
-            logger.info("Dispatcher control connection established")
-        elif event == "disconnected":
-            logger.info("Dispatcher control connection closed")
-        elif event == "permanent_error":
-            logger.error("Dispatcher encountered permanent error: %s", data)
-        elif event == "error":
-            logger.error("Dispatcher connection error: %s", data)
+        entry = self._CONNECTION_EVENT_LOGS.get(event)
+        if entry:
+            level, message, includes_data = entry
+            if includes_data:
+                logger.log(level, message, data)
+            else:
+                logger.log(level, message)
 
     def _derive_customer_id(self, api_key: str) -> str:
         """Reuse agent hashing logic to derive customer id."""
-        import hashlib
-
         return hashlib.md5(api_key.encode()).hexdigest()[:12]
 
 
 async def run_dispatcher(api_key: str, platform_url: str, search_path: Optional[Path] = None) -> None:
     """Convenience helper to run dispatcher until interrupted."""
+    loop = asyncio.get_running_loop()
     dispatcher = ConversimpleDispatcher(api_key=api_key, platform_url=platform_url, search_path=search_path)
     await dispatcher.start()
 
+    stop_event = asyncio.Event()
+    installed_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows event loops don't support signal handlers.
+            continue
+        installed_signals.append(sig)
+
     try:
-        while True:
-            await asyncio.sleep(1)
+        if installed_signals:
+            await stop_event.wait()
+            logger.info("Shutdown signal received, stopping dispatcher")
+        else:
+            while True:
+                await asyncio.sleep(1)
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received, stopping dispatcher")
     finally:
+        for sig in installed_signals:
+            loop.remove_signal_handler(sig)
         await dispatcher.stop()
+
@@ -10,17 +10,24 @@ Provides:
 
 import asyncio
 import inspect
-import json
 import logging
-from typing import Dict, List, Optional, Any, Callable, Union, get_type_hints
+import sys
+import weakref
+from typing import ClassVar, Dict, List, Optional, Any, Callable, Tuple, Union, get_type_hints
 from dataclasses import dataclass
 from datetime import datetime
 import datetime as dt
 
+from .utils import dumps_bytes
+
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__.
+# Manual __slots__ isn't an option because ToolCall's fields have defaults.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ToolCall:
     """Represents a tool call request from the platform."""
     call_id: str
@@ -35,6 +42,22 @@ class ToolCall:
             self.timestamp = datetime.now(dt.timezone.utc)
 
 
+@dataclass(frozen=True)
+class RawJSONResult:
+    """
+    Tool result that is already JSON-encoded.
+    
+    Returning one from a tool sends ``payload`` to the platform verbatim
+    instead of re-encoding a dict. Build it with ``RawJSONResult.encode(value)``.
+    """
+    payload: bytes
+
+    @classmethod
+    def encode(cls, value: Any) -> "RawJSONResult":
+        """Encode a JSON-serializable value, using orjson when available."""
+        return cls(dumps_bytes(value))
+
+
 class ToolRegistry:
     """
     Registry for managing customer tools.
@@ -43,21 +66,30 @@ class ToolRegistry:
     with support for both sync and async functions.
     """
 
+    # Generated schemas per underlying function and description, shared by every
+    # registry so each agent instance reuses them. Treat cached schemas as read-only.
+    _schema_cache: ClassVar["weakref.WeakKeyDictionary[Callable, Dict[str, Dict]]"] = weakref.WeakKeyDictionary()
+
     def __init__(self):
         self.sync_tools: Dict[str, Dict] = {}
         self.async_tools: Dict[str, Dict] = {}
+        self._tools_cache: Optional[List[Dict]] = None  # Reset whenever a registration changes a schema
 
     def register_sync_tool(self, func: Callable, description: str) -> None:
         """Register a synchronous tool function."""
         tool_name = func.__name__
         schema = self._generate_tool_schema(func, description)
         
+        existing = self.sync_tools.get(tool_name)
         self.sync_tools[tool_name] = {
             "function": func,
             "schema": schema,
             "description": description,
             "type": "sync"
         }
+        # Re-registering the same tool (e.g. on every start) reuses the cached schema
+        if existing is None or existing["schema"] is not schema:
+            self._tools_cache = None
         
         logger.debug(f"Registered sync tool: {tool_name}")
 
@@ -66,17 +98,29 @@ class ToolRegistry:
         tool_name = func.__name__
         schema = self._generate_tool_schema(func, description)
         
+        existing = self.async_tools.get(tool_name)
         self.async_tools[tool_name] = {
             "function": func,
             "schema": schema, 
             "description": description,
             "type": "async"
         }
+        # Re-registering the same tool (e.g. on every start) reuses the cached schema
+        if existing is None or existing["schema"] is not schema:
+            self._tools_cache = None
         
         logger.debug(f"Registered async tool: {tool_name}")
 
     def get_registered_tools(self) -> List[Dict]:
-        """Get all registered tools in platform format."""
+        """
+        Get all registered tools in platform format.
+        
+        The list is built once and reused until a registration adds or changes
+        a tool's schema, so callers must not modify it.
+        """
+        if self._tools_cache is not None:
+            return self._tools_cache
+            
         tools = []
         
         # Add sync tools
@@ -87,6 +131,7 @@ class ToolRegistry:
         for tool_name, tool_data in self.async_tools.items():
             tools.append(tool_data["schema"])
             
+        self._tools_cache = tools
         return tools
 
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
@@ -124,10 +169,26 @@ class ToolRegistry:
         else:
             raise ValueError(f"Tool not found: {tool_name}")
 
-    def _generate_tool_schema(self, func: Callable, description: str) -> Dict:
-        """Generate JSON schema for a tool function."""
+    @classmethod
+    def _generate_tool_schema(cls, func: Callable, description: str) -> Dict:
+        """Generate JSON schema for a tool function, reusing a cached one when possible."""
+        # Bound methods are recreated per instance; key on the function they wrap
+        key = getattr(func, "__func__", func)
+        try:
+            by_description = cls._schema_cache.setdefault(key, {})
+        except TypeError:  # Not weak-referenceable (e.g. some builtins); don't cache
+            return cls._build_tool_schema(func, description)
+        
+        schema = by_description.get(description)
+        if schema is None:
+            schema = by_description[description] = cls._build_tool_schema(func, description)
+        return schema
+
+    @classmethod
+    def _build_tool_schema(cls, func: Callable, description: str) -> Dict:
+        """Build JSON schema for a tool function from its signature and type hints."""
         signature = inspect.signature(func)
-        type_hints = get_type_hints(func)
+        type_hints = cls._get_type_hints(func)
         
         parameters = {
             "type": "object",
@@ -141,7 +202,7 @@ class ToolRegistry:
             if param_name == "self":
                 continue
                 
-            param_schema = self._get_parameter_schema(param, type_hints.get(param_name))
+            param_schema = cls._get_parameter_schema(param, type_hints.get(param_name))
             parameters["properties"][param_name] = param_schema
             
             # Add to required if no default value
@@ -154,13 +215,23 @@ class ToolRegistry:
             "parameters": parameters
         }
 
-    def _get_parameter_schema(self, param: inspect.Parameter, type_hint: Any) -> Dict:
+    @staticmethod
+    def _get_type_hints(func: Callable) -> Dict[str, Any]:
+        """Get type hints for func, skipping get_type_hints when nothing needs resolving."""
+        annotations = getattr(func, "__annotations__", None) or {}
+        # Only string (forward reference) annotations need get_type_hints to eval them
+        if any(isinstance(hint, str) for hint in annotations.values()):
+            return get_type_hints(func)
+        return annotations
+
+    @classmethod
+    def _get_parameter_schema(cls, param: inspect.Parameter, type_hint: Any) -> Dict:
         """Generate schema for a single parameter."""
         schema = {}
         
         # Handle type hints
         if type_hint:
-            schema.update(self._type_to_schema(type_hint))
+            schema.update(cls._type_to_schema(type_hint))
         else:
             schema["type"] = "string"  # Default fallback
             
@@ -170,7 +241,8 @@ class ToolRegistry:
         
         return schema
 
-    def _type_to_schema(self, type_hint: Any) -> Dict:
+    @classmethod
+    def _type_to_schema(cls, type_hint: Any) -> Dict:
         """Convert Python type hint to JSON schema."""
         # Handle basic types
         if type_hint == str:
@@ -194,7 +266,7 @@ class ToolRegistry:
                 if len(args) == 2 and type(None) in args:
                     # This is Optional[T] - get the non-None type
                     non_none_type = args[0] if args[1] is type(None) else args[1]
-                    schema = self._type_to_schema(non_none_type)
+                    schema = cls._type_to_schema(non_none_type)
                     # JSON Schema doesn't have nullable, but we can document it
                     return schema
                     
@@ -204,7 +276,7 @@ class ToolRegistry:
                     item_type = type_hint.__args__[0]
                     return {
                         "type": "array",
-                        "items": self._type_to_schema(item_type)
+                        "items": cls._type_to_schema(item_type)
                     }
                 else:
                     return {"type": "array"}
@@ -264,16 +336,38 @@ def tool_async(description: str):
     return decorator
 
 
+def collect_tool_specs(cls: type) -> Tuple[Tuple[str, Dict], ...]:
+    """
+    Find the tools decorated with @tool or @tool_async on a class.
+    
+    Returns:
+        Tuple of (attribute name, tool_info) pairs, in dir() order
+    """
+    specs = []
+    for attr_name in dir(cls):
+        tool_info = getattr(getattr(cls, attr_name, None), '_conversimple_tool', None)
+        if tool_info is not None:
+            specs.append((attr_name, tool_info))
+    return tuple(specs)
+
+
 def discover_tools(obj: Any) -> List[tuple]:
     """
     Discover tools decorated with @tool or @tool_async in an object.
     
+    Uses the class-level specs cached by ConversimpleAgent subclasses when
+    present, otherwise scans the object.
+    
     Args:
         obj: Object to scan for decorated methods
         
     Returns:
         List of (method, tool_info) tuples
     """
+    specs = type(obj).__dict__.get('_conversimple_tool_specs')
+    if specs is not None:
+        return [(getattr(obj, attr_name), tool_info) for attr_name, tool_info in specs]
+    
     tools = []
     
     # Get all methods of the object
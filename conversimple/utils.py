@@ -4,13 +4,20 @@ Logging and utility functions for Conversimple SDK.
 Provides:
 - Logging configuration
 - Helper utilities
+- JSON encoding and decoding (orjson when installed)
 - Common constants
 """
 
+import json
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    orjson = None  # type: ignore[assignment]
 
 
 def setup_logging(
@@ -47,6 +54,34 @@ def setup_logging(
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+# orjson takes str or bytes directly and its JSONDecodeError subclasses
+# json.JSONDecodeError, so callers see no difference.
+loads: Callable[[Union[str, bytes]], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: bool = False,
+    newline: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when available.
+    
+    Args:
+        obj: JSON-serializable value
+        indent: Pretty-print with 2-space indentation
+        newline: Append a trailing newline (for NDJSON)
+        default: Called for objects that aren't natively serializable
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(obj, default=default, indent=2 if indent else None)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
 def get_environment_config() -> dict:
     """Get configuration from environment variables."""
     return {
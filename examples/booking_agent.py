@@ -2,9 +2,13 @@
 
 import asyncio
 import logging
-from typing import Dict, Optional
+import os
+from array import array
+from dataclasses import asdict, dataclass
+from itertools import compress
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum
 
 from conversimple import ConversimpleAgent, tool, tool_async
 
@@ -13,12 +17,63 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class BookingStatus(Enum):
-    """Booking status enumeration."""
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    CANCELLED = "cancelled"
-    COMPLETED = "completed"
+def _collect_free(mask, service_ids, durations) -> List[Tuple[int, int, int]]:
+    """
+    Return (slot, service_id, duration) for every set byte in a day's mask.
+    
+    compress/zip walk the columns in C, so no Python-level loop runs per slot.
+    """
+    return list(compress(zip(range(len(mask)), service_ids, durations), mask))
+
+
+class BookingStatus(IntEnum):
+    """
+    Booking status enumeration.
+    
+    Members are compared by identity internally and exposed to tool callers
+    as their lowercase name (see ``label``).
+    """
+    PENDING = 0
+    CONFIRMED = 1
+    CANCELLED = 2
+    COMPLETED = 3
+
+    @property
+    def label(self) -> str:
+        """String form used in tool responses."""
+        return self.name.lower()
+
+
+@dataclass
+class Booking:
+    """Internal booking record; converted to a dict only when returned from a tool."""
+
+    __slots__ = (
+        "booking_id", "customer", "appointment", "appointment_dt", "price_display",
+        "special_requests", "status", "created_at", "confirmation_code", "confirmed_at",
+        "cancelled_at", "cancellation_reason", "rescheduled_at"
+    )
+
+    booking_id: str
+    customer: Dict
+    appointment: Dict
+    appointment_dt: datetime
+    price_display: str
+    special_requests: Optional[str]
+    status: BookingStatus
+    created_at: str
+    confirmation_code: str
+    confirmed_at: Optional[str]
+    cancelled_at: Optional[str]
+    cancellation_reason: Optional[str]
+    rescheduled_at: Optional[str]
+
+    def to_dict(self) -> Dict:
+        """Build the tool-facing representation of this booking."""
+        record = asdict(self)
+        del record["appointment_dt"], record["price_display"]
+        record["status"] = self.status.label
+        return record
 
 
 class BookingAgent(ConversimpleAgent):
@@ -31,19 +86,45 @@ class BookingAgent(ConversimpleAgent):
     - Workflow orchestration
     - Validation and business rules
     - Transaction-like booking processes
+    
+    Set ``CONVERSIMPLE_SIMULATE_LATENCY=1`` (or pass ``simulate_latency=True``)
+    to add the artificial delays that stand in for a real booking backend; by
+    default tools return immediately.
     """
 
     agent_id = "example-booking-agent"
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, simulate_latency: Optional[bool] = None, **kwargs):
         super().__init__(*args, **kwargs)
         
+        if simulate_latency is None:
+            simulate_latency = bool(int(os.getenv("CONVERSIMPLE_SIMULATE_LATENCY", "0")))
+        self._simulate_latency = simulate_latency
+        
         # Booking state management
-        self.active_bookings: Dict[str, Dict] = {}
+        self.active_bookings: Dict[str, Booking] = {}
         self.booking_sessions: Dict[str, Dict] = {}
+        self._by_conf_code: Dict[str, str] = {}  # confirmation code -> booking ID
+        
+        # Service catalog
+        self.services = {
+            "consultation": {
+                "name": "Consultation",
+                "duration": 60,
+                "price": 150.00,
+                "description": "Initial consultation and assessment"
+            },
+            "full_service": {
+                "name": "Full Service Session", 
+                "duration": 120,
+                "price": 300.00,
+                "description": "Complete service session with follow-up"
+            }
+        }
+        self._service_keys: List[str] = list(self.services)
         
         # Mock availability data
-        self.availability = {
+        self._load_availability({
             "2025-01-29": {
                 "09:00": {"available": True, "service": "consultation", "duration": 60},
                 "10:00": {"available": True, "service": "consultation", "duration": 60},
@@ -58,24 +139,56 @@ class BookingAgent(ConversimpleAgent):
                 "15:00": {"available": True, "service": "full_service", "duration": 120},
                 "17:00": {"available": True, "service": "consultation", "duration": 60}
             }
-        }
+        })
+
+    def _load_availability(self, availability: Dict[str, Dict[str, Dict]]) -> None:
+        """
+        Pack availability into flat column arrays.
         
-        # Service catalog
-        self.services = {
-            "consultation": {
-                "name": "Consultation",
-                "duration": 60,
-                "price": 150.00,
-                "description": "Initial consultation and assessment"
-            },
-            "full_service": {
-                "name": "Full Service Session", 
-                "duration": 120,
-                "price": 300.00,
-                "description": "Complete service session with follow-up"
-            }
+        Each column is indexed by ``day * slots_per_day + slot`` so a scan over
+        one day touches a contiguous run of bytes instead of nested dicts.
+        """
+        self._dates: List[str] = list(availability)
+        self._slot_times: List[str] = sorted({t for slots in availability.values() for t in slots})
+        self._day_index: Dict[str, int] = {d: i for i, d in enumerate(self._dates)}
+        self._slot_index: Dict[str, int] = {t: i for i, t in enumerate(self._slot_times)}
+        
+        cells = len(self._dates) * len(self._slot_times)
+        self._slot_exists = bytearray(cells)
+        self._available = bytearray(cells)
+        self._service_id = array("h", [-1]) * cells
+        self._duration = array("h", [0]) * cells
+        
+        for date, slots in availability.items():
+            for slot_time, slot in slots.items():
+                cell = self._cell(date, slot_time)
+                self._slot_exists[cell] = 1
+                self._available[cell] = slot["available"]
+                if slot["service"] is not None:
+                    self._service_id[cell] = self._service_keys.index(slot["service"])
+                self._duration[cell] = slot["duration"] or 0
+
+    def _cell(self, date: str, slot_time: str) -> Optional[int]:
+        """Return the flat column index for a date/time, or None if unknown."""
+        day = self._day_index.get(date)
+        slot = self._slot_index.get(slot_time)
+        if day is None or slot is None:
+            return None
+        return day * len(self._slot_times) + slot
+
+    def _slot_info(self, service_id: int, duration: int) -> Dict:
+        """Materialize the service/duration fields for a single slot."""
+        return {
+            "service": self._service_keys[service_id] if service_id >= 0 else None,
+            "duration": duration or None
         }
 
+    def _set_available(self, date: str, slot_time: str, available: bool) -> None:
+        """Flip availability for a slot if it exists."""
+        cell = self._cell(date, slot_time)
+        if cell is not None and self._slot_exists[cell]:
+            self._available[cell] = available
+
     @tool("Check availability for specific date and time")
     def check_availability(self, date: str, time: str = None) -> Dict:
         """
@@ -88,47 +201,51 @@ class BookingAgent(ConversimpleAgent):
         Returns:
             Availability information
         """
-        logger.info(f"Checking availability for {date} {time or 'all day'}")
+        logger.info("Checking availability for %s %s", date, time or "all day")
         
-        if date not in self.availability:
+        day = self._day_index.get(date)
+        if day is None:
             return {
                 "date": date,
                 "available": False,
                 "message": "No availability data for this date",
-                "suggestions": list(self.availability.keys())
+                "suggestions": list(self._dates)
             }
         
-        day_availability = self.availability[date]
+        width = len(self._slot_times)
+        start = day * width
+        end = start + width
         
         if time:
             # Check specific time
-            if time in day_availability:
-                slot = day_availability[time]
+            cell = self._cell(date, time)
+            if cell is not None and self._slot_exists[cell]:
                 return {
                     "date": date,
                     "time": time,
-                    "available": slot["available"],
-                    "service": slot["service"],
-                    "duration": slot["duration"]
+                    "available": bool(self._available[cell]),
+                    **self._slot_info(self._service_id[cell], self._duration[cell])
                 }
             else:
+                day_slots = compress(self._slot_times, self._slot_exists[start:end])
                 return {
                     "date": date,
                     "time": time,
                     "available": False,
                     "message": "Time slot not found",
-                    "available_times": list(day_availability.keys())
+                    "available_times": list(day_slots)
                 }
         else:
             # Return all availability for the day
-            available_slots = []
-            for slot_time, slot_info in day_availability.items():
-                if slot_info["available"]:
-                    available_slots.append({
-                        "time": slot_time,
-                        "service": slot_info["service"],
-                        "duration": slot_info["duration"]
-                    })
+            free = _collect_free(
+                self._available[start:end],
+                self._service_id[start:end],
+                self._duration[start:end]
+            )
+            available_slots = [
+                {"time": self._slot_times[slot], **self._slot_info(service_id, duration)}
+                for slot, service_id, duration in free
+            ]
             
             return {
                 "date": date,
@@ -182,7 +299,7 @@ class BookingAgent(ConversimpleAgent):
         Returns:
             Booking creation result
         """
-        logger.info(f"Creating booking for {customer_name} on {date} at {time}")
+        logger.info("Creating booking for %s on %s at %s", customer_name, date, time)
         
         # Validate service
         if service not in self.services:
@@ -202,42 +319,50 @@ class BookingAgent(ConversimpleAgent):
             }
         
         # Simulate booking creation delay
-        await asyncio.sleep(0.5)
+        if self._simulate_latency:
+            await asyncio.sleep(0.5)
         
         # Generate booking ID
-        booking_id = f"BKG-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        now = datetime.now()
+        booking_id = f"BKG-{now.strftime('%Y%m%d%H%M%S')}"
         
         # Create booking record
-        booking = {
-            "booking_id": booking_id,
-            "customer": {
+        booking = Booking(
+            booking_id=booking_id,
+            customer={
                 "name": customer_name,
                 "email": customer_email,
                 "phone": customer_phone
             },
-            "appointment": {
+            appointment={
                 "date": date,
                 "time": time,
                 "service": service,
                 "duration": self.services[service]["duration"],
                 "price": self.services[service]["price"]
             },
-            "special_requests": special_requests,
-            "status": BookingStatus.PENDING.value,
-            "created_at": datetime.now().isoformat(),
-            "confirmation_code": f"CONF-{booking_id[-8:]}"
-        }
+            appointment_dt=datetime.fromisoformat(f"{date}T{time}"),
+            price_display=f"${self.services[service]['price']:.2f}",
+            special_requests=special_requests,
+            status=BookingStatus.PENDING,
+            created_at=now.isoformat(),
+            confirmation_code=f"CONF-{booking_id[-8:]}",
+            confirmed_at=None,
+            cancelled_at=None,
+            cancellation_reason=None,
+            rescheduled_at=None
+        )
         
         # Store booking
         self.active_bookings[booking_id] = booking
+        self._by_conf_code[booking.confirmation_code] = booking_id
         
         # Mark time slot as unavailable
-        if date in self.availability and time in self.availability[date]:
-            self.availability[date][time]["available"] = False
+        self._set_available(date, time, False)
             
         return {
             "success": True,
-            "booking": booking,
+            "booking": booking.to_dict(),
             "message": f"Booking {booking_id} created successfully",
             "next_steps": "Please confirm this booking to finalize your reservation"
         }
@@ -253,7 +378,7 @@ class BookingAgent(ConversimpleAgent):
         Returns:
             Confirmation result
         """
-        logger.info(f"Confirming booking: {booking_id}")
+        logger.info("Confirming booking: %s", booking_id)
         
         if booking_id not in self.active_bookings:
             return {
@@ -264,40 +389,42 @@ class BookingAgent(ConversimpleAgent):
             
         booking = self.active_bookings[booking_id]
         
-        if booking["status"] != BookingStatus.PENDING.value:
+        if booking.status is not BookingStatus.PENDING:
             return {
                 "success": False,
-                "error": f"Booking is already {booking['status']}",
-                "current_status": booking["status"]
+                "error": f"Booking is already {booking.status.label}",
+                "current_status": booking.status.label
             }
         
         # Simulate confirmation processing
-        await asyncio.sleep(0.3)
+        if self._simulate_latency:
+            await asyncio.sleep(0.3)
         
         # Update booking status
-        booking["status"] = BookingStatus.CONFIRMED.value
-        booking["confirmed_at"] = datetime.now().isoformat()
+        booking.status = BookingStatus.CONFIRMED
+        booking.confirmed_at = datetime.now().isoformat()
         
         # Generate calendar event details
-        appointment_datetime = datetime.fromisoformat(f"{booking['appointment']['date']}T{booking['appointment']['time']}")
+        appointment = booking.appointment
+        appointment_datetime = booking.appointment_dt
         
         confirmation_details = {
             "success": True,
             "booking_id": booking_id,
-            "status": "confirmed",
-            "confirmation_code": booking["confirmation_code"],
+            "status": booking.status.label,
+            "confirmation_code": booking.confirmation_code,
             "appointment_details": {
-                "date": booking["appointment"]["date"],
-                "time": booking["appointment"]["time"],
-                "service": booking["appointment"]["service"],
-                "duration": f"{booking['appointment']['duration']} minutes",
-                "price": f"${booking['appointment']['price']:.2f}"
+                "date": appointment["date"],
+                "time": appointment["time"],
+                "service": appointment["service"],
+                "duration": f"{appointment['duration']} minutes",
+                "price": booking.price_display
             },
-            "customer": booking["customer"],
+            "customer": booking.customer,
             "calendar_event": {
-                "title": f"{self.services[booking['appointment']['service']]['name']} - {booking['customer']['name']}",
+                "title": f"{self.services[appointment['service']]['name']} - {booking.customer['name']}",
                 "start_time": appointment_datetime.isoformat(),
-                "end_time": (appointment_datetime + timedelta(minutes=booking['appointment']['duration'])).isoformat()
+                "end_time": (appointment_datetime + timedelta(minutes=appointment['duration'])).isoformat()
             }
         }
         
@@ -315,7 +442,7 @@ class BookingAgent(ConversimpleAgent):
         Returns:
             Cancellation result
         """
-        logger.info(f"Cancelling booking: {booking_id}")
+        logger.info("Cancelling booking: %s", booking_id)
         
         if booking_id not in self.active_bookings:
             return {
@@ -325,15 +452,16 @@ class BookingAgent(ConversimpleAgent):
             
         booking = self.active_bookings[booking_id]
         
-        if booking["status"] == BookingStatus.CANCELLED.value:
+        if booking.status is BookingStatus.CANCELLED:
             return {
                 "success": False,
                 "error": "Booking is already cancelled"
             }
         
         # Check cancellation policy (24 hours)
-        appointment_datetime = datetime.fromisoformat(f"{booking['appointment']['date']}T{booking['appointment']['time']}")
-        hours_until_appointment = (appointment_datetime - datetime.now()).total_seconds() / 3600
+        now = datetime.now()
+        appointment_datetime = booking.appointment_dt
+        hours_until_appointment = (appointment_datetime - now).total_seconds() / 3600
         
         if hours_until_appointment < 24:
             return {
@@ -344,20 +472,19 @@ class BookingAgent(ConversimpleAgent):
             }
         
         # Cancel the booking
-        booking["status"] = BookingStatus.CANCELLED.value
-        booking["cancelled_at"] = datetime.now().isoformat()
-        booking["cancellation_reason"] = reason
+        booking.status = BookingStatus.CANCELLED
+        booking.cancelled_at = now.isoformat()
+        booking.cancellation_reason = reason
         
         # Free up the time slot
-        date = booking["appointment"]["date"]
-        time = booking["appointment"]["time"]
-        if date in self.availability and time in self.availability[date]:
-            self.availability[date][time]["available"] = True
+        date = booking.appointment["date"]
+        time = booking.appointment["time"]
+        self._set_available(date, time, True)
             
         return {
             "success": True,
             "booking_id": booking_id,
-            "status": "cancelled",
+            "status": booking.status.label,
             "refund_eligible": True,
             "message": "Booking cancelled successfully"
         }
@@ -380,7 +507,7 @@ class BookingAgent(ConversimpleAgent):
         Returns:
             Reschedule result
         """
-        logger.info(f"Rescheduling booking {booking_id} to {new_date} {new_time}")
+        logger.info("Rescheduling booking %s to %s %s", booking_id, new_date, new_time)
         
         if booking_id not in self.active_bookings:
             return {
@@ -400,19 +527,18 @@ class BookingAgent(ConversimpleAgent):
             }
         
         # Free up old slot
-        old_date = booking["appointment"]["date"]
-        old_time = booking["appointment"]["time"]
-        if old_date in self.availability and old_time in self.availability[old_date]:
-            self.availability[old_date][old_time]["available"] = True
+        old_date = booking.appointment["date"]
+        old_time = booking.appointment["time"]
+        self._set_available(old_date, old_time, True)
         
         # Book new slot
-        if new_date in self.availability and new_time in self.availability[new_date]:
-            self.availability[new_date][new_time]["available"] = False
+        self._set_available(new_date, new_time, False)
         
         # Update booking
-        booking["appointment"]["date"] = new_date
-        booking["appointment"]["time"] = new_time
-        booking["rescheduled_at"] = datetime.now().isoformat()
+        booking.appointment["date"] = new_date
+        booking.appointment["time"] = new_time
+        booking.appointment_dt = datetime.fromisoformat(f"{new_date}T{new_time}")
+        booking.rescheduled_at = datetime.now().isoformat()
         
         return {
             "success": True,
@@ -433,23 +559,17 @@ class BookingAgent(ConversimpleAgent):
         Returns:
             Booking details
         """
-        logger.info(f"Retrieving booking: {identifier}")
+        logger.info("Retrieving booking: %s", identifier)
         
-        # Search by booking ID first
-        if identifier in self.active_bookings:
+        # Resolve confirmation codes to booking IDs, then look up directly
+        booking_id = self._by_conf_code.get(identifier, identifier)
+        booking = self.active_bookings.get(booking_id)
+        if booking:
             return {
                 "found": True,
-                "booking": self.active_bookings[identifier]
+                "booking": booking.to_dict()
             }
         
-        # Search by confirmation code
-        for booking_id, booking in self.active_bookings.items():
-            if booking["confirmation_code"] == identifier:
-                return {
-                    "found": True,
-                    "booking": booking
-                }
-        
         return {
             "found": False,
             "error": "Booking not found",
@@ -459,22 +579,22 @@ class BookingAgent(ConversimpleAgent):
     # Event handlers
     def on_conversation_started(self, conversation_id: str) -> None:
         """Handle conversation started events."""
-        logger.info(f"📅 Booking agent ready: {conversation_id}")
+        logger.info("📅 Booking agent ready: %s", conversation_id)
         print("Booking agent is ready to help with appointments!")
         print("Available services: consultations, full service sessions")
 
     def on_conversation_ended(self, conversation_id: str) -> None:
         """Handle conversation ended events."""
-        logger.info(f"Booking conversation ended: {conversation_id}")
+        logger.info("Booking conversation ended: %s", conversation_id)
         print("Thank you for using our booking service!")
 
     def on_tool_called(self, tool_call) -> None:
         """Handle tool call events."""
-        logger.info(f"🔧 Executing booking tool: {tool_call.tool_name}")
+        logger.info("🔧 Executing booking tool: %s", tool_call.tool_name)
 
     def on_error(self, error_type: str, error_message: str, details: Dict) -> None:
         """Handle error events including circuit breaker."""
-        logger.error(f"❌ Booking agent error ({error_type}): {error_message}")
+        logger.error("❌ Booking agent error (%s): %s", error_type, error_message)
 
         if error_type in ["AUTH_FAILED", "CUSTOMER_SUSPENDED"]:
             print(f"🚫 Booking service unavailable: {error_message}")
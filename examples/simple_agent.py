@@ -1,6 +1,7 @@
 """Simple weather agent definition discovered by the dispatcher."""
 
 import logging
+from types import MappingProxyType
 from typing import Dict
 
 from conversimple import ConversimpleAgent, tool
@@ -9,6 +10,35 @@ from conversimple import ConversimpleAgent, tool
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Simulated conditions shared by every get_weather response
+_WEATHER_DEFAULTS = MappingProxyType({
+    "temperature": 22,
+    "condition": "sunny",
+    "humidity": 65,
+    "wind_speed": 10
+})
+
+# Simulated forecast pattern, repeating every three days
+_CONDITIONS = ("sunny", "cloudy", "rainy")
+_PRECIPITATION = (0, 20, 80)
+
+
+def _build_forecast(location: str, days: int) -> Dict:
+    """Build a simulated multi-day forecast."""
+    return {
+        "location": location,
+        "days": days,
+        "forecast": [
+            {
+                "day": day + 1,
+                "temperature": 20 + (day * 2),
+                "condition": _CONDITIONS[day % 3],
+                "precipitation": _PRECIPITATION[day % 3]
+            }
+            for day in range(days)
+        ]
+    }
+
 
 class WeatherAgent(ConversimpleAgent):
     """
@@ -33,16 +63,13 @@ class WeatherAgent(ConversimpleAgent):
         Returns:
             Dictionary with weather information
         """
-        logger.info(f"Getting weather for: {location}")
+        logger.info("Getting weather for: %s", location)
         
         # Simulate weather API call
         # In production, this would call a real weather service
         weather_data = {
             "location": location,
-            "temperature": 22,
-            "condition": "sunny",
-            "humidity": 65,
-            "wind_speed": 10,
+            **_WEATHER_DEFAULTS,
             "description": f"It's a beautiful sunny day in {location} with a temperature of 22°C"
         }
         
@@ -60,48 +87,34 @@ class WeatherAgent(ConversimpleAgent):
         Returns:
             Dictionary with forecast information
         """
-        logger.info(f"Getting {days}-day forecast for: {location}")
+        logger.info("Getting %s-day forecast for: %s", days, location)
         
         # Simulate forecast data
-        forecast = {
-            "location": location,
-            "days": days,
-            "forecast": []
-        }
-        
-        for day in range(days):
-            forecast["forecast"].append({
-                "day": day + 1,
-                "temperature": 20 + (day * 2),
-                "condition": ["sunny", "cloudy", "rainy"][day % 3],
-                "precipitation": [0, 20, 80][day % 3]
-            })
-            
-        return forecast
+        return _build_forecast(location, days)
 
     def on_conversation_started(self, conversation_id: str) -> None:
         """Handle conversation started events."""
-        logger.info(f"🌤️  Weather agent ready for conversation: {conversation_id}")
+        logger.info("🌤️  Weather agent ready for conversation: %s", conversation_id)
         print(f"Weather agent is now active and ready to help with weather information!")
 
     def on_conversation_ended(self, conversation_id: str) -> None:
         """Handle conversation ended events."""
-        logger.info(f"Weather agent conversation ended: {conversation_id}")
+        logger.info("Weather agent conversation ended: %s", conversation_id)
         print(f"Weather agent conversation ended. Goodbye!")
 
     def on_tool_called(self, tool_call) -> None:
         """Handle tool call events."""
-        logger.info(f"🔧 Weather tool called: {tool_call.tool_name}")
+        logger.info("🔧 Weather tool called: %s", tool_call.tool_name)
         print(f"Executing weather tool: {tool_call.tool_name}")
 
     def on_tool_completed(self, call_id: str, result) -> None:
         """Handle tool completion events."""
-        logger.info(f"✅ Weather tool completed: {call_id}")
+        logger.info("✅ Weather tool completed: %s", call_id)
         print(f"Weather tool completed successfully")
 
     def on_error(self, error_type: str, error_message: str, details: Dict) -> None:
         """Handle error events including circuit breaker."""
-        logger.error(f"❌ Weather agent error ({error_type}): {error_message}")
+        logger.error("❌ Weather agent error (%s): %s", error_type, error_message)
 
         # Handle different error types
         if error_type == "AUTH_FAILED":
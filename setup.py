@@ -60,11 +60,16 @@ setup(
         "examples": [
             "aiofiles>=23.0",
             "aiohttp>=3.8.0",
-        ]
+        ],
+        "speedups": [
+            "orjson>=3.8",
+            "uvloop>=0.17; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
             "conversimple-example=examples.simple_agent:main",
+            "conversimple-dispatcher=conversimple.cli:main",
         ],
     },
     keywords="conversational ai, voice ai, chatbot, websocket, sdk, speech to text, text to speech",
@@ -5,24 +5,63 @@ This script tests the basic SDK components without requiring
 a running platform instance.
 """
 
+import argparse
 import asyncio
+import io
 import logging
 import json
-from typing import Dict
+import operator
+import os
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO
 
-# Configure logging to see what's happening
-logging.basicConfig(level=logging.INFO)
+# Configure logging; set CONVERSIMPLE_TEST_LOGLEVEL=INFO to see what's happening
+LOG_LEVEL = os.environ.get("CONVERSIMPLE_TEST_LOGLEVEL", "WARNING").upper()
+# Agents configure the SDK logger from CONVERSIMPLE_LOG_LEVEL, so keep it in step
+os.environ.setdefault("CONVERSIMPLE_LOG_LEVEL", LOG_LEVEL)
+logging.basicConfig(level=getattr(logging, LOG_LEVEL, logging.WARNING))
 logger = logging.getLogger(__name__)
 
+# Set CONVERSIMPLE_TEST_VERBOSE=1 to print every tool result (skipped by default for timing runs)
+VERBOSE = os.environ.get("CONVERSIMPLE_TEST_VERBOSE") == "1"
+
+# Set by --ndjson: one JSON object per line instead of the human-readable report
+NDJSON = False
+
 # Test imports
 try:
-    from conversimple import ConversimpleAgent, tool, tool_async
-    print("✅ SDK imports successful")
+    from conversimple import ConversimpleAgent, RawJSONResult, tool, tool_async
+    from conversimple.dispatcher import AgentRegistry
+    from conversimple.tools import ToolRegistry, auto_register_tools
+    from conversimple.utils import dumps_bytes
 except ImportError as e:
     print(f"❌ Import error: {e}")
     exit(1)
 
 
+def dump_json(obj: Any, out: TextIO) -> None:
+    """Write obj as 2-space indented JSON, with orjson when available."""
+    out.write(dumps_bytes(obj, indent=True).decode())
+
+
+def event_line(event: str, **fields: Any) -> str:
+    """Format one NDJSON event line, with orjson when available."""
+    record = {"event": event, **fields}
+    return dumps_bytes(record, newline=True, default=str).decode()
+
+
+# Operations supported by TestAgent.calculate
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv
+}
+
+
 class TestAgent(ConversimpleAgent):
     """Test agent to verify SDK functionality."""
 
@@ -48,20 +87,15 @@ class TestAgent(ConversimpleAgent):
     @tool("Calculate simple math")
     def calculate(self, operation: str, a: float, b: float) -> Dict:
         """Test tool with multiple parameters."""
-        operations = {
-            "add": a + b,
-            "subtract": a - b,
-            "multiply": a * b,
-            "divide": a / b if b != 0 else None
-        }
-        
-        if operation not in operations:
+        op = _OPS.get(operation)
+        if op is None:
             return {"error": f"Unknown operation: {operation}"}
             
-        result = operations[operation]
-        if result is None:
+        if op is operator.truediv and b == 0:
             return {"error": "Division by zero"}
             
+        result = op(a, b)
+
         return {
             "operation": operation,
             "inputs": {"a": a, "b": b},
@@ -75,73 +109,98 @@ class TestAgent(ConversimpleAgent):
         print(f"🔧 Tool called: {tool_call.tool_name}")
 
 
-async def test_tool_discovery():
-    """Test tool discovery and schema generation."""
-    print("\n📋 Testing Tool Discovery")
-    print("=" * 40)
-    
-    # Create agent (won't connect to platform)
+def create_test_agent() -> TestAgent:
+    """Create a TestAgent with its tools registered (won't connect to platform)."""
     agent = TestAgent(api_key="test-key", customer_id="test-customer")
     
     # Auto-register tools
-    from conversimple.tools import auto_register_tools
     auto_register_tools(agent)
+    return agent
+
+
+async def test_tool_discovery(agent: Optional[TestAgent] = None, out: TextIO = sys.stdout):
+    """Test tool discovery and schema generation."""
+    # Output is collected and written once at the end
+    lines = ["\n📋 Testing Tool Discovery", "=" * 40]
+    
+    agent = agent or create_test_agent()
     
     # Check registered tools
     tools = agent.tool_registry.get_registered_tools()
     
-    print(f"Discovered {len(tools)} tools:")
+    if NDJSON:
+        out.write("".join(
+            event_line(
+                "tool_discovered",
+                name=tool['name'],
+                description=tool['description'],
+                parameters=tool['parameters']
+            )
+            for tool in tools
+        ))
+        return
+    
+    lines.append(f"Discovered {len(tools)} tools:")
     for tool in tools:
-        print(f"  - {tool['name']}: {tool['description']}")
-        print(f"    Parameters: {len(tool['parameters']['properties'])}")
-        
+        params = tool['parameters']
+        props = params['properties']
+        required_set = frozenset(params.get('required', ()))
+
+        lines.append(f"  - {tool['name']}: {tool['description']}")
+        lines.append(f"    Parameters: {len(props)}")
+
         # Show parameter details
-        for param_name, param_schema in tool['parameters']['properties'].items():
-            required = "required" if param_name in tool['parameters'].get('required', []) else "optional"
-            print(f"      • {param_name} ({param_schema['type']}, {required})")
-        print()
+        for param_name, param_schema in props.items():
+            required = "required" if param_name in required_set else "optional"
+            lines.append(f"      • {param_name} ({param_schema['type']}, {required})")
+        lines.append("")
+    
+    out.write("\n".join(lines) + "\n")
 
 
-async def test_tool_execution():
+async def test_tool_execution(agent: Optional[TestAgent] = None, out: TextIO = sys.stdout):
     """Test tool execution."""
-    print("\n🔧 Testing Tool Execution")
-    print("=" * 40)
+    lines = ["\n🔧 Testing Tool Execution", "=" * 40]
     
-    agent = TestAgent(api_key="test-key", customer_id="test-customer")
-    from conversimple.tools import auto_register_tools
-    auto_register_tools(agent)
+    agent = agent or create_test_agent()
     
-    # Test sync tool
-    print("Testing sync tool: get_greeting")
-    result = await agent.tool_registry.execute_tool("get_greeting", {"name": "Alice", "formal": True})
-    print(f"  Result: {result}")
+    calls = [
+        ("Testing sync tool: get_greeting", "get_greeting", {"name": "Alice", "formal": True}),
+        ("Testing async tool: async_api_call", "async_api_call", {"endpoint": "/users", "timeout": 10}),
+        ("Testing math tool: calculate", "calculate", {"operation": "multiply", "a": 7, "b": 6}),
+        ("Testing error handling: division by zero", "calculate", {"operation": "divide", "a": 10, "b": 0}),
+    ]
     
-    # Test async tool
-    print("Testing async tool: async_api_call")
-    result = await agent.tool_registry.execute_tool("async_api_call", {"endpoint": "/users", "timeout": 10})
-    print(f"  Result: {result}")
+    execute_tool = agent.tool_registry.execute_tool
+
+    # The calls are independent, so run them together; one failure doesn't cancel the rest
+    results = await asyncio.gather(
+        *(execute_tool(name, arguments) for _, name, arguments in calls),
+        return_exceptions=True
+    )
     
-    # Test math tool
-    print("Testing math tool: calculate")
-    result = await agent.tool_registry.execute_tool("calculate", {"operation": "multiply", "a": 7, "b": 6})
-    print(f"  Result: {result}")
+    if NDJSON:
+        events = []
+        for (_, name, arguments), result in zip(calls, results):
+            failed = isinstance(result, BaseException)
+            fields = {"error": str(result)} if failed else ({"result": result} if VERBOSE else {})
+            events.append(event_line("tool_executed", tool=name, arguments=arguments, ok=not failed, **fields))
+        out.write("".join(events))
+    else:
+        for (label, _, _), result in zip(calls, results):
+            lines.append(label)
+            if VERBOSE:
+                lines.append(f"  Result: {result}")
+        
+        out.write("\n".join(lines) + "\n")
     
-    # Test error handling
-    print("Testing error handling: division by zero")
-    result = await agent.tool_registry.execute_tool("calculate", {"operation": "divide", "a": 10, "b": 0})
-    print(f"  Result: {result}")
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        raise failures[0]
 
 
-def test_schema_generation():
+def test_schema_generation(out: TextIO = sys.stdout):
     """Test JSON schema generation from type hints."""
-    print("\n📝 Testing Schema Generation")
-    print("=" * 40)
-    
-    from conversimple.tools import ToolRegistry
-    import inspect
-    
-    registry = ToolRegistry()
-    
     # Test function with various parameter types
     def test_function(
         name: str,
@@ -154,33 +213,242 @@ def test_schema_generation():
     ) -> dict:
         pass
     
-    schema = registry._generate_tool_schema(test_function, "Test function with various types")
+    # Schema generation is a classmethod, so no registry instance is needed
+    schema = ToolRegistry._generate_tool_schema(test_function, "Test function with various types")
+    
+    if NDJSON:
+        out.write(event_line("schema_generated", schema=schema))
+        return
+    
+    out.write("\n📝 Testing Schema Generation\n" + "=" * 40 + "\nGenerated schema:\n")
+    dump_json(schema, out)
+    out.write("\n")
+
+
+class _CapturingWebSocket:
+    """Stand-in websocket that keeps every frame sent through it."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, frame) -> None:
+        self.frames.append(frame)
+
+
+async def test_tool_result_frames(out: TextIO = sys.stdout):
+    """Test that tool results go out as valid Phoenix frames."""
+    agent = create_test_agent()
+    websocket = _CapturingWebSocket()
+    connection = agent.connection
+    connection.connected = connection.channel_joined = True
+    connection.websocket = websocket
+    
+    cases = [
+        ("call-dict", {"message": "Hello, Alice!", "count": 2}),
+        ("call-raw", RawJSONResult.encode({"balance": 45.75, "orders": ["ORD-003"]})),
+        ('call-\u00e9\u2713"quoted"', {"message": "Good day"}),
+        ('call-\u00e9\u2713"raw"', RawJSONResult.encode({"message": "Bonne journ\u00e9e"})),
+    ]
+    for call_id, result in cases:
+        await agent._send_tool_result(call_id, result)
+    
+    if len(websocket.frames) != len(cases):
+        raise AssertionError(f"expected {len(cases)} frames, got {len(websocket.frames)}")
+    for (call_id, result), frame in zip(cases, websocket.frames):
+        message = json.loads(frame)
+        expected = json.loads(result.payload) if isinstance(result, RawJSONResult) else result
+        if message["event"] != "tool_call_response" or message["payload"] != {"call_id": call_id, "result": expected}:
+            raise AssertionError(f"unexpected frame for {call_id!r}: {frame}")
+    
+    if NDJSON:
+        out.write(event_line("tool_result_frames_checked", frames=len(websocket.frames)))
+        return
+    
+    out.write("\n📤 Testing Tool Result Frames\n" + "=" * 40 + "\n")
+    out.write(f"Decoded {len(websocket.frames)} tool_call_response frames\n")
+
+
+def _discover_agents(search_path: Path, files: Dict[str, str]) -> AgentRegistry:
+    """Write agent modules into a new directory and discover them."""
+    search_path.mkdir()
+    for name, source in files.items():
+        (search_path / name).write_text(textwrap.dedent(source))
+    registry = AgentRegistry(search_path)
+    registry.discover()
+    return registry
+
+
+def test_agent_registry(out: TextIO = sys.stdout):
+    """Test that agent discovery only registers real agent classes."""
+    with tempfile.TemporaryDirectory(prefix="conversimple_registry_") as root:
+        root = Path(root)
+        
+        # A non-agent class declaring an id must not shadow the real agent
+        registry = _discover_agents(root / "shadowed", {
+            "registry_a_config.py": """
+                class Config(dict):
+                    agent_id = "weather"
+            """,
+            "registry_b_weather.py": """
+                from conversimple import ConversimpleAgent
+
+                class WeatherAgent(ConversimpleAgent):
+                    agent_id = "weather"
+            """,
+        })
+        registered = registry.get("weather")
+        if registered is None or registered.cls.__name__ != "WeatherAgent":
+            raise AssertionError(f"weather resolved to {registered}")
+        
+        # agent_id takes precedence over AGENT_ID; a class gets one id, not both
+        registry = _discover_agents(root / "both_ids", {
+            "registry_both_ids.py": """
+                from conversimple import ConversimpleAgent
+
+                class BothAgent(ConversimpleAgent):
+                    agent_id = "a-id"
+                    AGENT_ID = "A-ID"
+            """,
+        })
+        if sorted(registry.agents) != ["a-id"]:
+            raise AssertionError(f"expected only a-id, got {sorted(registry.agents)}")
+        
+        # Agents defined in a block or built with type() sit next to a literal one
+        registry = _discover_agents(root / "mixed", {
+            "registry_mixed.py": """
+                import os
+                from conversimple import ConversimpleAgent
+
+                class LiteralAgent(ConversimpleAgent):
+                    agent_id = "literal"
+
+                if os.sep:
+                    class BlockAgent(ConversimpleAgent):
+                        agent_id = "block"
+
+                BuiltAgent = type("BuiltAgent", (ConversimpleAgent,), {"agent_id": "built"})
+            """,
+        })
+        if registry.get("literal") is None or sorted(registry.agents) != ["block", "built", "literal"]:
+            raise AssertionError(f"expected block, built and literal, got {sorted(registry.agents)}")
+
+        # An inherited agent_id also wins over the subclass's own AGENT_ID
+        registry = _discover_agents(root / "inherited_id", {
+            "registry_inherited_id.py": """
+                from conversimple import ConversimpleAgent
+
+                class Base(ConversimpleAgent):
+                    agent_id = "base"
+
+                class Sub(Base):
+                    AGENT_ID = "sub"
+            """,
+        })
+        if sorted(registry.agents) != ["base"] or registry.get("base").cls.__name__ != "Base":
+            raise AssertionError(f"expected only base, got {sorted(registry.agents)}")
+        
+        # An agent inheriting its id from a base imported from elsewhere is still found
+        base_path = root / "base"
+        base_path.mkdir()
+        (base_path / "registry_company_base.py").write_text(textwrap.dedent("""
+            from conversimple import ConversimpleAgent
+
+            class CompanyBase(ConversimpleAgent):
+                def __init_subclass__(cls, **kwargs):
+                    super().__init_subclass__(**kwargs)
+                    cls.agent_id = f"company-{cls.__name__.lower()}"
+        """))
+        sys.path.insert(0, str(base_path))
+        try:
+            registry = _discover_agents(root / "inherited", {
+                "registry_company.py": """
+                    from conversimple import ConversimpleAgent
+                    from registry_company_base import CompanyBase
+
+                    class SupportAgent(ConversimpleAgent):
+                        agent_id = "company-support"
+
+                    class Sales(CompanyBase):
+                        pass
+                """,
+            })
+        finally:
+            sys.path.remove(str(base_path))
+        registered = registry.get("company-sales")
+        if registered is None or registered.cls.__name__ != "Sales":
+            raise AssertionError(f"company-sales resolved to {registered}")
+        if registry.get("company-support") is None:
+            raise AssertionError("company-support was not registered")
+    
+    if NDJSON:
+        out.write(event_line("agent_registry_checked", agents=sorted(registry.agents)))
+        return
     
-    print("Generated schema:")
-    print(json.dumps(schema, indent=2))
+    out.write("\n🗂️  Testing Agent Registry\n" + "=" * 40 + "\n")
+    out.write(f"Discovered agents: {', '.join(sorted(registry.agents))}\n")
 
 
 async def main():
     """Run all tests."""
-    print("🧪 Conversimple SDK Test Suite")
-    print("=" * 50)
+    if NDJSON:
+        sys.stdout.write(event_line("suite_started"))
+    else:
+        print("✅ SDK imports successful")
+        print("🧪 Conversimple SDK Test Suite")
+        print("=" * 50)
+    
+    # Tests run concurrently, each printing to its own buffer so output stays in order
+    buffers = [io.StringIO() for _ in range(5)]
     
     try:
+        # One agent shared by the tests, so tools are registered once
+        agent = create_test_agent()
+        
         # Run tests
-        await test_tool_discovery()
-        await test_tool_execution()
-        test_schema_generation()
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(
+                test_tool_discovery(agent, buffers[0]),
+                test_tool_execution(agent, buffers[1]),
+                loop.run_in_executor(None, test_schema_generation, buffers[2]),
+                loop.run_in_executor(None, test_agent_registry, buffers[3]),
+                test_tool_result_frames(buffers[4])
+            )
+        finally:
+            for buffer in buffers:
+                sys.stdout.write(buffer.getvalue())
+        
+        if NDJSON:
+            sys.stdout.write(event_line("suite_passed"))
+            return
         
         print("\n✅ All tests passed!")
         print("\n💡 Next steps:")
         print("1. Set up environment variables (CONVERSIMPLE_API_KEY, CONVERSIMPLE_CUSTOMER_ID)")
-        print("2. Run example agents via dispatcher: python -m conversimple.dispatcher --search-path ./examples")
+        print("2. Run example agents via dispatcher: python -m conversimple --search-path ./examples")
         print("3. Start developing your own agents!")
         
     except Exception as e:
-        print(f"\n❌ Test failed: {e}")
+        if NDJSON:
+            sys.stdout.write(event_line("suite_failed", error=str(e)))
+        else:
+            print(f"\n❌ Test failed: {e}")
         logger.exception("Test failure details:")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Conversimple SDK smoke tests")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--ndjson", dest="ndjson", action="store_true",
+                        help="Emit one JSON event per line for machine consumption")
+    output.add_argument("--pretty", dest="ndjson", action="store_false",
+                        help="Emit the human-readable report (default)")
+    NDJSON = parser.parse_args().ndjson
+    
+    try:
+        import uvloop
+    except ImportError:  # Optional speedup, installed with the "speedups" extra
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())